@@ -4,7 +4,7 @@ from pathlib import Path
 # Add src directory to Python path - only place this is needed
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from sql.sql_seeder import run_sql_seeders
+import sql
 from shared.load import load_config
 
 
@@ -15,10 +15,12 @@ def main():
     config = load_config()
     print(f"Loaded config for environment: {config.production and 'production' or 'development'}")
 
-    run_sql_seeders(config)
+    sql.run_sql_seeders(config)
     # run_nosql_seeders()  # in the future
   except Exception as e:
     print(f"Error: {e}")
+  finally:
+    sql.close_all()
 
 
 if __name__ == "__main__":
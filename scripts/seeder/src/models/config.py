@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Database(BaseModel):
@@ -227,19 +227,13 @@ class FeaturesAdvanced(BaseModel):
 
 
 class FeaturesLimitsCollection(BaseModel):
-  global_: Optional[GlobalLimits] = None
+  model_config = ConfigDict(populate_by_name=True)
+
+  # 'global' is a Python keyword, so the YAML key is mapped through an alias
+  global_: Optional[GlobalLimits] = Field(default=None, alias="global")
   new_user: Optional[FeaturesLimits] = None
   default: Optional[FeaturesLimits] = None
 
-  def __init__(self, **data):
-    # Handle the 'global' key from YAML
-    if 'global' in data:
-      data['global_'] = data.pop('global')
-    super().__init__(**data)
-  
-  class Config:
-    populate_by_name = True
-
 
 class Features(BaseModel):
   limits: FeaturesLimitsCollection
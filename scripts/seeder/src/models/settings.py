@@ -1 +1,19 @@
 NUMBER_OF_USERS = 50
+# How seeded rows are written: "copy" (COPY FROM STDIN), "values" (batched INSERT ... VALUES),
+# "unnest" (one INSERT ... SELECT FROM UNNEST of per-column arrays)
+# or "pipeline" (per-row prepared INSERTs sent in psycopg pipeline mode)
+INSERT_METHOD = "copy"
+# Rows per statement for the "values" insert method. Each row binds one parameter per
+# column and Postgres allows 65535 per statement, so larger pages are capped
+# (4369 rows for the 15 users columns)
+INSERT_PAGE_SIZE = 1000
+SEED_PASSWORD = "password123"
+# Hash the seed password per user (unique salts) instead of once for everyone
+UNIQUE_PASSWORD_HASHES = False
+# Argon2 parameters for seeded passwords, far below production since the data is throwaway
+SEED_HASH_TIME_COST = 1
+SEED_HASH_MEMORY_COST = 1024
+# Max SQL seeders run concurrently, each on its own pooled connection
+SQL_SEEDER_WORKERS = 4
+# Faker seed so repeated runs generate the same names and text (None for random output)
+FAKER_SEED = 42
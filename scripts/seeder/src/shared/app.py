@@ -1,16 +1,93 @@
+import base64
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING
 
-import argon2
+if TYPE_CHECKING:
+  import argon2
+
+# Production Argon2 parameters, callers may lower them for throwaway data
+DEFAULT_TIME_COST = 2
+DEFAULT_MEMORY_COST = 19456
+
+# Maps the RFC 4648 base32 alphabet onto Crockford's, which ULIDs use
+_CROCKFORD = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567',
+                             b'0123456789ABCDEFGHJKMNPQRSTVWXYZ')
+
+
+@lru_cache(maxsize=None)
+def _get_hasher(time_cost: int, memory_cost: int) -> 'argon2.PasswordHasher':
+  # Built once per process (including pool workers) and parameter set
+  import argon2
+
+  return argon2.PasswordHasher(time_cost=time_cost,
+                               memory_cost=memory_cost,
+                               parallelism=1,
+                               hash_len=32,
+                               salt_len=16)
 
 
 def get_time_miliseconds():
   return int(datetime.now().timestamp() * 1000)
 
 
-def generate_argon2_hash(password: str) -> str:
-  hasher = argon2.PasswordHasher(time_cost=2,
-                                 memory_cost=19456,
-                                 parallelism=1,
-                                 hash_len=32,
-                                 salt_len=16)
-  return hasher.hash(password)
+def generate_ulids(n: int) -> list[str]:
+  """
+  Generate n ULID strings sharing the current millisecond timestamp.
+  
+  Each ULID is 48 bits of timestamp followed by 80 random bits. The 128 bit
+  value is shifted into a 17 byte frame so the C base32 encoder emits the
+  26 ULID characters first, which are then mapped to Crockford's alphabet.
+  
+  Args:
+    n: Number of ULIDs to generate
+    
+  Returns:
+    26 character ULID strings
+  """
+  prefix = get_time_miliseconds().to_bytes(6, 'big')
+  rand = os.urandom(10 * n)
+
+  ulids = []
+  for i in range(0, 10 * n, 10):
+    value = int.from_bytes(prefix + rand[i:i + 10], 'big') << 6
+    encoded = base64.b32encode(value.to_bytes(17, 'big'))[:26]
+    ulids.append(encoded.translate(_CROCKFORD).decode('ascii'))
+  return ulids
+
+
+def generate_argon2_hash(password: str,
+                         *,
+                         time_cost: int = DEFAULT_TIME_COST,
+                         memory_cost: int = DEFAULT_MEMORY_COST) -> str:
+  return _get_hasher(time_cost, memory_cost).hash(password)
+
+
+def generate_argon2_hash_batch(passwords: list[str],
+                               *,
+                               time_cost: int = DEFAULT_TIME_COST,
+                               memory_cost: int = DEFAULT_MEMORY_COST) -> list[str]:
+  """
+  Hash many passwords in parallel, one worker process per CPU core.
+  Each worker reuses its cached PasswordHasher.
+  
+  Args:
+    passwords: Plain text passwords to hash
+    time_cost: Argon2 iterations
+    memory_cost: Argon2 memory in KiB
+    
+  Returns:
+    Argon2 hashes in the same order as the input passwords
+  """
+  if not passwords:
+    return []
+
+  workers = min(os.cpu_count() or 1, len(passwords))
+  chunksize = max(1, len(passwords) // (workers * 4))
+
+  hash_one = partial(generate_argon2_hash, time_cost=time_cost, memory_cost=memory_cost)
+
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    return list(executor.map(hash_one, passwords, chunksize=chunksize))
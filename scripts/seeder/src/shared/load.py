@@ -1,26 +1,91 @@
+import hashlib
+import importlib.metadata
 import os
+import pickle
+import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
+# yaml and the pydantic models are imported on first use to keep startup
+# and early error paths (bad ENV, missing file) cheap
+if TYPE_CHECKING:
+  from models.config import Config
 
-from models.config import Config
+CACHE_DIR = Path.home() / '.cache' / 'chaty-seeder'
 
+# Repository root, where chaty.dev.yaml and chaty.local.yaml live
+_ROOT = Path(__file__).resolve().parents[4]
+_VALID_ENVS = frozenset({'dev', 'local', 'production'})
+# Pickled configs depend on these model definitions, so they are part of the cache key
+_MODELS_FILE = Path(__file__).resolve().parents[1] / 'models' / 'config.py'
 
-def load_config() -> Config:
+
+def load_config() -> 'Config':
   env = os.getenv('ENV', 'local')
 
-  if env not in ['dev', 'local', 'production']:
+  if env not in _VALID_ENVS:
     raise ValueError(f"Invalid environment: {env}. Must be one of: 'dev', 'local', 'production'")
 
-  # Build path to config file (relative to this seeder script location)
-  # The files are at ../../../../chaty.dev.yaml and ../../../../chaty.local.yaml
-  script_dir = Path(__file__).parent.parent.parent.parent.parent
-  config_file = script_dir / f"chaty.{env}.yaml"
+  config_file = _ROOT / f"chaty.{env}.yaml"
 
   if not config_file.exists():
     raise FileNotFoundError(f"Config file not found: {config_file}")
 
+  use_cache = os.getenv('CHATY_SEEDER_CACHE') == '1'
+  if use_cache:
+    stat = config_file.stat()
+    # Pickled models are only safe to load with the same model definitions and pydantic
+    models_version = hashlib.sha1(_MODELS_FILE.read_bytes()).hexdigest()[:12]
+    pydantic_version = importlib.metadata.version('pydantic')
+    cache_file = (CACHE_DIR / f"{env}-{models_version}-{pydantic_version}-"
+                  f"{stat.st_mtime_ns}-{stat.st_size}.pkl")
+    cached = _read_cache(cache_file)
+    if cached is not None:
+      return cached
+
+  import yaml
+  try:
+    from yaml import CSafeLoader as SafeLoader
+  except ImportError:
+    from yaml import SafeLoader
+
+  from models.config import Config
+
   with open(config_file, 'r') as f:
-    config_data = yaml.safe_load(f)
+    config_data = yaml.load(f, Loader=SafeLoader)
+
+  config = Config(**config_data)
+
+  if use_cache:
+    _write_cache(cache_file, env, config)
+
+  return config
+
+
+def _read_cache(cache_file: Path):
+  # Any unreadable or incompatible cache entry falls back to parsing the YAML
+  try:
+    with open(cache_file, 'rb') as f:
+      return pickle.load(f)
+  except Exception:
+    return None
+
+
+def _write_cache(cache_file: Path, env: str, config: 'Config'):
+  """
+  Write the parsed config next to its final location, then rename it into place
+  so concurrent runs never read a partially written cache file. Older cache
+  files for the same env are removed, since their key can no longer match.
+  """
+  try:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+      pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_file)
 
-  return Config(**config_data)
+    for stale in cache_file.parent.glob(f"{env}-*.pkl"):
+      if stale != cache_file:
+        stale.unlink(missing_ok=True)
+  except OSError as e:
+    print(f"Warning: failed to write config cache {cache_file}: {e}")
@@ -0,0 +1,19 @@
+import sys
+
+
+def __getattr__(name):
+  # Defer importing the seeders (and psycopg/faker behind them) until first use
+  if name == 'run_sql_seeders':
+    from sql.sql_seeder import run_sql_seeders
+    return run_sql_seeders
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def close_all():
+  """
+  Close the shared connection pool, if the seeders ever opened one.
+  Checks sys.modules so psycopg is not imported just to close nothing.
+  """
+  db = sys.modules.get('sql.db')
+  if db:
+    db.DatabasePool.close_all()
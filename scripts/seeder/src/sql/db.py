@@ -1,8 +1,12 @@
+import atexit
 import threading
 from urllib.parse import urlparse
 
-from psycopg2 import pool
-from psycopg2.extensions import connection
+from psycopg import Connection, Cursor
+from psycopg_pool import ConnectionPool
+
+# Postgres rejects statements with more bind parameters than this
+MAX_QUERY_PARAMS = 65535
 
 
 class DatabasePool:
@@ -14,27 +18,31 @@ class DatabasePool:
   def initialize(cls, minconn=1, maxconn=10, **db_params):
     with cls._lock:
       if cls._pool is None:
-        cls._pool = pool.ThreadedConnectionPool(minconn, maxconn, **db_params)
+        cls._pool = ConnectionPool(kwargs=db_params, min_size=minconn, max_size=maxconn, open=True)
         cls._initialized = True
+        # Safety net in case the caller never closes the pool explicitly
+        atexit.register(cls.close_all)
       elif not cls._initialized:
         raise RuntimeError("DatabasePool is already initialized.")
 
   @classmethod
-  def get_conn(cls) -> connection:
+  def get_conn(cls) -> Connection:
     if cls._pool is None:
       raise RuntimeError("Database is not initialized")
     return cls._pool.getconn()
 
   @classmethod
-  def release_conn(cls, conn: connection):
+  def release_conn(cls, conn: Connection):
     if cls._pool:
       cls._pool.putconn(conn)
 
   @classmethod
   def close_all(cls):
-    if cls._pool:
-      cls._pool.closeall()
-      cls._initialized = False
+    with cls._lock:
+      if cls._pool:
+        cls._pool.close()
+        cls._pool = None
+        cls._initialized = False
 
 
 def parse_postgres_url(postgres_url: str) -> dict:
@@ -47,7 +55,7 @@ def parse_postgres_url(postgres_url: str) -> dict:
     postgres_url: PostgreSQL connection URL
     
   Returns:
-    Dictionary with host, port, user, password, and database
+    Dictionary with host, port, user, password, and dbname
   """
   parsed = urlparse(postgres_url)
 
@@ -56,5 +64,84 @@ def parse_postgres_url(postgres_url: str) -> dict:
       'port': parsed.port or 5432,
       'user': parsed.username or 'postgres',
       'password': parsed.password or '',
-      'database': parsed.path.lstrip('/') or 'postgres'
+      'dbname': parsed.path.lstrip('/') or 'postgres'
   }
+
+
+def insert_values(cur: Cursor, table: str, columns: tuple, rows: list, page_size: int):
+  """
+  Insert rows with multi-row INSERT ... VALUES statements, page_size rows per statement.
+  
+  Each row binds one parameter per column, so page_size is capped to keep a
+  statement within MAX_QUERY_PARAMS.
+  
+  Args:
+    cur: Open cursor
+    table: Target table name
+    columns: Column names, in the same order as each row tuple
+    rows: Row tuples to insert
+    page_size: Rows sent per statement
+  """
+  page_size = min(page_size, MAX_QUERY_PARAMS // len(columns))
+  row_placeholder = f"({', '.join(['%s'] * len(columns))})"
+
+  for start in range(0, len(rows), page_size):
+    page = rows[start:start + page_size]
+    values = ', '.join([row_placeholder] * len(page))
+    params = [value for row in page for value in row]
+    cur.execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES {values}", params)
+
+
+def insert_pipeline(cur: Cursor, table: str, columns: tuple, rows: list):
+  """
+  Insert rows one statement each, in pipeline mode, so statements are sent
+  without waiting for the previous result. The INSERT is prepared server-side
+  on first use, so Postgres parses and plans it once.
+  
+  Args:
+    cur: Open cursor
+    table: Target table name
+    columns: Column names, in the same order as each row tuple
+    rows: Row tuples to insert
+  """
+  stmt = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+  with cur.connection.pipeline():
+    for row in rows:
+      cur.execute(stmt, row, prepare=True)
+
+
+def insert_unnest(cur: Cursor, table: str, columns: tuple, column_types: tuple, rows: list):
+  """
+  Insert all rows in one statement by sending each column as a single array
+  and expanding them server-side with UNNEST. Statement size stays one row of
+  parameters regardless of the number of rows.
+  
+  Args:
+    cur: Open cursor
+    table: Target table name
+    columns: Column names, in the same order as each row tuple
+    column_types: Postgres type of each column, used to cast the arrays
+    rows: Row tuples to insert
+  """
+  if not rows:
+    return
+
+  arrays = ', '.join(f"%s::{column_type}[]" for column_type in column_types)
+  stmt = f"INSERT INTO {table} ({', '.join(columns)}) SELECT * FROM UNNEST({arrays})"
+  cur.execute(stmt, [list(column) for column in zip(*rows)])
+
+
+def copy_rows(cur: Cursor, table: str, columns: tuple, rows: list):
+  """
+  Bulk load rows through COPY FROM STDIN, bypassing per-row statement parsing.
+  
+  Args:
+    cur: Open cursor
+    table: Target table name
+    columns: Column names, in the same order as each row tuple
+    rows: Row tuples to insert
+  """
+  with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+    for row in rows:
+      copy.write_row(row)
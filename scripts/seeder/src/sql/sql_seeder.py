@@ -1,26 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg
+
 from models.config import Config
+from models.settings import SQL_SEEDER_WORKERS
 from sql.db import DatabasePool, parse_postgres_url
 from sql.users import seed_users_table
 
+# Independent seeders, safe to run concurrently in separate transactions
+SQL_SEEDERS = [seed_users_table]
+
 
 def run_sql_seeders(cfg: Config):
   """
-  Initialize database connection pool and run all SQL seeders.
+  Run all SQL seeders. A single seeder (or SQL_SEEDER_WORKERS = 1) runs on one
+  plain connection; otherwise seeders run concurrently on a pool sized to the workers.
+  """
+  db_params = parse_postgres_url(cfg.database.postgres)
+  workers = min(SQL_SEEDER_WORKERS, len(SQL_SEEDERS))
+
+  if workers > 1:
+    _run_parallel(cfg, db_params, workers)
+  else:
+    _run_serial(cfg, db_params)
+
+  print("Database seeding completed successfully")
+
+
+def _run_serial(cfg: Config, db_params: dict):
+  """
+  Run seeders one after another on a single connection.
   Wraps seeders in transaction for automatic rollback on failure.
   """
 
   conn = None
   try:
-    db_params = parse_postgres_url(cfg.database.postgres)
-    DatabasePool.initialize(minconn=1, maxconn=10, **db_params)
-    conn = DatabasePool.get_conn()
+    # Seeders run serially on one connection, so a pool would only add overhead
+    conn = psycopg.connect(**db_params)
 
     # Run all seeders with the connection
-    seed_users_table(conn, cfg)
+    for seeder in SQL_SEEDERS:
+      seeder(conn, cfg)
 
     # Commit the transaction
     conn.commit()
-    print("Database seeding completed successfully")
 
   except Exception as e:
     if conn:
@@ -28,5 +51,32 @@ def run_sql_seeders(cfg: Config):
     raise RuntimeError(f"Failed to run SQL seeders: {e}")
   finally:
     if conn:
-      DatabasePool.release_conn(conn)
-    DatabasePool.close_all()
+      conn.close()
+
+
+def _run_parallel(cfg: Config, db_params: dict, workers: int):
+  """
+  Run each seeder as its own task with its own pooled connection and transaction.
+  A failing seeder rolls back only its own work. The pool is left open so later
+  seeders reuse its connections; main() closes it once everything has run.
+  """
+
+  DatabasePool.initialize(minconn=workers, maxconn=workers, **db_params)
+  with ThreadPoolExecutor(max_workers=workers) as executor:
+    futures = [executor.submit(_run_in_transaction, seeder, cfg) for seeder in SQL_SEEDERS]
+
+  errors = [f.exception() for f in futures if f.exception() is not None]
+  if errors:
+    raise RuntimeError(f"Failed to run SQL seeders: {'; '.join(map(str, errors))}")
+
+
+def _run_in_transaction(seeder, cfg: Config):
+  conn = DatabasePool.get_conn()
+  try:
+    seeder(conn, cfg)
+    conn.commit()
+  except Exception:
+    conn.rollback()
+    raise
+  finally:
+    DatabasePool.release_conn(conn)
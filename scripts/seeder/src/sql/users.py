@@ -1,13 +1,52 @@
-from faker import Faker
-from psycopg2.extensions import connection
-from ulid import ULID
+from functools import partial
+
+from psycopg import Connection
 
 from models.config import Config
-from models.settings import NUMBER_OF_USERS
-from shared.app import generate_argon2_hash, get_time_miliseconds
+from models.settings import (FAKER_SEED, INSERT_METHOD, INSERT_PAGE_SIZE, NUMBER_OF_USERS,
+                             SEED_HASH_MEMORY_COST, SEED_HASH_TIME_COST, SEED_PASSWORD,
+                             UNIQUE_PASSWORD_HASHES)
+from shared.app import (generate_argon2_hash, generate_argon2_hash_batch, generate_ulids,
+                        get_time_miliseconds)
+from sql.db import copy_rows, insert_pipeline, insert_unnest, insert_values
+
+# Seeded users columns and their Postgres types, in the order of each row tuple
+USERS_COLUMN_DEFS = (
+    ('id', 'varchar'),
+    ('username', 'varchar'),
+    ('email', 'varchar'),
+    ('password_hash', 'varchar'),
+    ('display_name', 'varchar'),
+    ('badges', 'int'),
+    ('status_text', 'varchar'),
+    ('status_presence', 'varchar'),
+    ('profile_content', 'text'),
+    ('profile_background_id', 'varchar'),
+    ('privileged', 'boolean'),
+    ('suspended_until', 'bigint'),
+    ('created_at', 'bigint'),
+    ('updated_at', 'bigint'),
+    ('verified', 'boolean'),
+)
+USERS_COLUMNS = tuple(name for name, _ in USERS_COLUMN_DEFS)
+USERS_COLUMN_TYPES = tuple(column_type for _, column_type in USERS_COLUMN_DEFS)
+
+# users.status_text is VARCHAR(510); Postgres counts VARCHAR length in characters,
+# not bytes, so slicing the str by code points matches the column limit exactly
+STATUS_TEXT_MAX_LENGTH = 510
+
+# INSERT_METHOD name -> function writing the generated rows into the users table
+_INSERT_METHODS = {
+    'copy': partial(copy_rows, table="users", columns=USERS_COLUMNS),
+    'unnest': partial(insert_unnest, table="users", columns=USERS_COLUMNS,
+                      column_types=USERS_COLUMN_TYPES),
+    'pipeline': partial(insert_pipeline, table="users", columns=USERS_COLUMNS),
+    'values': partial(insert_values, table="users", columns=USERS_COLUMNS,
+                      page_size=INSERT_PAGE_SIZE),
+}
 
 
-def seed_users_table(con: connection, cfg: Config):
+def seed_users_table(con: Connection, cfg: Config):
   """
   Seed the users table with realistic test data using Faker.
   Creates NUMBER_OF_USERS users with generated usernames and emails.
@@ -16,58 +55,65 @@ def seed_users_table(con: connection, cfg: Config):
     con: PostgreSQL database connection
     cfg: Application configuration
   """
+  # Reject a bad INSERT_METHOD before spending time hashing and generating rows
+  insert_rows = _INSERT_METHODS.get(INSERT_METHOD)
+  if insert_rows is None:
+    raise ValueError(f"Invalid insert method: {INSERT_METHOD}. "
+                     f"Must be one of: {', '.join(repr(m) for m in _INSERT_METHODS)}")
+
+  # Faker loads dozens of provider modules, so it is only imported when seeding runs
+  from faker import Faker
+
   cursor = con.cursor()
+  # A fixed seed repeats the Faker generated fields (names, text, badges and flags)
+  # across runs; ids, timestamps and the run tag still differ per run
+  if FAKER_SEED is not None:
+    Faker.seed(FAKER_SEED)
   fake = Faker()
 
   current_time = get_time_miliseconds()
 
-  # Prepare the INSERT statement
-  insert_stmt = """
-    INSERT INTO users (
-      id, username, email, password_hash, display_name, badges,
-      status_text, status_presence, profile_content, profile_background_id,
-      privileged, suspended_until, created_at, updated_at, verified
-    ) VALUES (
-      %s, %s, %s, %s, %s, %s,
-      %s, %s, %s, %s,
-      %s, %s, %s, %s, %s
-    )
-  """
+  # Every seeded user shares the same password, so hash it once unless
+  # per-user salts are explicitly requested (hashed in parallel across cores).
+  # Seeded accounts are throwaway, so the hashes use cheap Argon2 parameters
+  hash_params = {'time_cost': SEED_HASH_TIME_COST, 'memory_cost': SEED_HASH_MEMORY_COST}
+  if UNIQUE_PASSWORD_HASHES:
+    password_hashes = generate_argon2_hash_batch([SEED_PASSWORD] * NUMBER_OF_USERS, **hash_params)
+  else:
+    password_hashes = [generate_argon2_hash(SEED_PASSWORD, **hash_params)] * NUMBER_OF_USERS
 
-  # Generate and insert users
-  used_usernames = set()
-  used_emails = set()
-
-  for _ in range(NUMBER_OF_USERS):
-    user_id = str(ULID())
-
-    while True:
-      username = fake.user_name()
-      if username not in used_usernames:
-        used_usernames.add(username)
-        break
-
-    while True:
-      email = fake.email()
-      if email not in used_emails:
-        used_emails.add(email)
-        break
-
-    password_hash = generate_argon2_hash("password123")
-
-    display_name = fake.name()
-    badges = fake.random_int(min=0, max=5)
-    status_text = fake.sentence()[:510]  # Limit to 510 chars as per schema
-    status_presence = "online"
-    profile_content = fake.paragraph()
-    profile_background_id = None
-    privileged = fake.boolean(chance_of_getting_true=10)  # 10% chance
-    suspended_until = None
-    verified = fake.boolean(chance_of_getting_true=80)  # 80% chance verified
-
-    cursor.execute(insert_stmt,
-                   (user_id, username, email, password_hash, display_name, badges, status_text,
-                    status_presence, profile_content, profile_background_id, privileged,
-                    suspended_until, current_time, current_time, verified))
+  # Generate every column in bulk, then assemble the rows in a single pass
+  n = NUMBER_OF_USERS
+  rnd = fake.random
+  user_ids = generate_ulids(n)
+  identities = _fake_identities(fake, n, f"{current_time:x}")
+  usernames = [identity[0] for identity in identities]
+  emails = [identity[1] for identity in identities]
+  display_names = [identity[2] for identity in identities]
+  badges = rnd.choices(range(6), k=n)
+  status_texts = [s[:STATUS_TEXT_MAX_LENGTH] for s in fake.sentences(nb=n)]
+  profile_contents = fake.paragraphs(nb=n)
+  privileged = [rnd.random() < 0.1 for _ in range(n)]  # 10% chance
+  verified = [rnd.random() < 0.8 for _ in range(n)]  # 80% chance verified
+
+  rows = [(user_ids[i], usernames[i], emails[i], password_hashes[i], display_names[i], badges[i],
+           status_texts[i], "online", profile_contents[i], None, privileged[i], None,
+           current_time, current_time, verified[i]) for i in range(n)]
+
+  insert_rows(cursor, rows=rows)
 
   print(f"Seeded {NUMBER_OF_USERS} users")
+
+
+def _fake_identities(fake, n: int, run_tag: str) -> list:
+  """
+  Generate (username, email, display_name) for n users in one pass.
+  
+  Provider methods are resolved once up front instead of going through the
+  Faker proxy lookup on every call. The run tag and row index suffix keep
+  usernames and emails unique, within a run and across reruns against the
+  same database, without retrying on collisions.
+  """
+  user_name, domain_name, name = fake.user_name, fake.domain_name, fake.name
+  return [(f"{user_name()}_{run_tag}{i:06d}", f"user{run_tag}{i:08d}@{domain_name()}", name())
+          for i in range(n)]